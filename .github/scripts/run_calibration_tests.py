@@ -7,7 +7,7 @@ from freemocap.data_layer.recording_models.recording_info_model import Recording
 logger = logging.getLogger(__name__)
 
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 # from freemocap.core_processes.capture_volume_calibration.anipose_camera_calibration.anipose_camera_calibrator import (
 #     AniposeCameraCalibrator,
@@ -16,12 +16,16 @@ from freemocap.core_processes.capture_volume_calibration.charuco_stuff.charuco_b
     CharucoBoardDefinition,
 )
 
-import io
 import logging
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from freemocap.system.paths_and_filenames.file_and_folder_names import (
     FIGSHARE_SAMPLE_ZIP_FILE_URL,
@@ -33,37 +37,138 @@ from freemocap.system.paths_and_filenames.path_getters import get_recording_sess
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE_BYTES = 1 << 20
+SAMPLE_DATA_ETAG_FILE_NAME = ".sample_data.etag"  # written next to the extracted data, see `download_sample_data`
+NUMBER_OF_DOWNLOAD_RANGES = 4
+MIN_RANGED_DOWNLOAD_SIZE_BYTES = 8 << 20  # below this the extra requests cost more than they save
+
+
+def _create_session() -> requests.Session:
+    """Shared session so redirects (github release -> object storage) and retries reuse keep-alive sockets"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
 
 def get_sample_data_path(download_if_needed: bool = True) -> str:
-    sample_data_path = str(Path(get_recording_session_folder_path()) / FREEMOCAP_TEST_DATA_RECORDING_NAME)
-    if not Path(sample_data_path).exists():
+    sample_data_path = Path(get_recording_session_folder_path()) / FREEMOCAP_TEST_DATA_RECORDING_NAME
+    if not sample_data_path.exists():
         if download_if_needed:
             download_sample_data()
         else:
             raise Exception(f"Could not find sample data at {sample_data_path} (and `download_if_needed` is False)")
+    elif download_if_needed:
+        # only a copy extracted by `download_sample_data` has a fingerprint to compare; any other existing
+        # copy is used as is, and so is this one when the remote can't be checked (offline, HEAD rejected)
+        etag_path = sample_data_path / SAMPLE_DATA_ETAG_FILE_NAME
+        if etag_path.exists():
+            remote_headers = head_sample_data(FIGSHARE_TEST_ZIP_FILE_URL)
+            remote_fingerprint = get_remote_fingerprint(remote_headers)
+            if remote_fingerprint and etag_path.read_text() != remote_fingerprint:
+                download_sample_data(remote_headers=remote_headers)
 
-    return sample_data_path
+    return str(sample_data_path)
 
 
-def download_sample_data(sample_data_zip_file_url: str = FIGSHARE_TEST_ZIP_FILE_URL) -> str:
+def head_sample_data(zip_file_url: str) -> requests.structures.CaseInsensitiveDict:
+    """Headers of the remote archive - empty if the HEAD fails, so callers fall back to one plain streamed GET"""
+    try:
+        head = _SESSION.head(zip_file_url, allow_redirects=True, timeout=(5, 60))
+        head.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"HEAD {zip_file_url} failed ({e}), can't check for an up-to-date copy or use ranged downloads")
+        return requests.structures.CaseInsensitiveDict()
+    return head.headers
+
+
+def get_remote_fingerprint(headers: requests.structures.CaseInsensitiveDict) -> str:
+    """Identify the remote archive by its `ETag`/`Content-Length` (empty string if the server sends neither)"""
+    etag = headers.get("ETag", "")
+    content_length = headers.get("Content-Length", "")
+    if not etag and not content_length:
+        return ""
+    return f"{etag}|{content_length}"
+
+
+def _download_byte_range(zip_file_url: str, zip_file_path: Path, start: int, end: int) -> None:
+    r = _SESSION.get(zip_file_url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=(5, 60))
+    r.raise_for_status()
+    if r.status_code != 206:
+        raise requests.exceptions.HTTPError(f"Expected a partial response for bytes {start}-{end}, got {r.status_code}")
+
+    # one handle per range - `os.pwrite` is not available on the Windows runners
+    with open(zip_file_path, "r+b") as fh:
+        fh.seek(start)
+        for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
+            fh.write(chunk)
+
+
+def download_in_byte_ranges(zip_file_url: str, zip_file_path: Path, content_length: int,
+                            number_of_ranges: int = NUMBER_OF_DOWNLOAD_RANGES) -> None:
+    """Fetch the archive as `number_of_ranges` concurrent ranged GETs, each written at its offset of one file"""
+    with open(zip_file_path, "wb") as fh:
+        fh.truncate(content_length)
+
+    range_size = -(-content_length // number_of_ranges)
+    byte_ranges = [(start, min(start + range_size, content_length) - 1)
+                   for start in range(0, content_length, range_size)]
+    with ThreadPoolExecutor(max_workers=len(byte_ranges)) as executor:
+        futures = [executor.submit(_download_byte_range, zip_file_url, zip_file_path, start, end)
+                   for start, end in byte_ranges]
+        for future in futures:
+            future.result()
+
+
+def download_sample_data(sample_data_zip_file_url: str = FIGSHARE_TEST_ZIP_FILE_URL,
+                         remote_headers: Optional[requests.structures.CaseInsensitiveDict] = None) -> str:
+    """`remote_headers`: the archive's HEAD response if the caller already has it, saves a second HEAD"""
     try:
-        logger.info(f"Downloading sample data from {sample_data_zip_file_url}...")
-
         recording_session_folder_path = Path(get_recording_session_folder_path())
         recording_session_folder_path.mkdir(parents=True, exist_ok=True)
 
-        r = requests.get(sample_data_zip_file_url, stream=True, timeout=(5, 60))
-        r.raise_for_status()  # Check if request was successful
-
-        z = zipfile.ZipFile(io.BytesIO(r.content))
-        z.extractall(recording_session_folder_path)
-
         if sample_data_zip_file_url == FIGSHARE_TEST_ZIP_FILE_URL:
             figshare_sample_data_path = recording_session_folder_path / FREEMOCAP_TEST_DATA_RECORDING_NAME
         elif sample_data_zip_file_url == FIGSHARE_SAMPLE_ZIP_FILE_URL:
             figshare_sample_data_path = recording_session_folder_path / FREEMOCAP_SAMPLE_DATA_RECORDING_NAME
         else:
             figshare_sample_data_path = recording_session_folder_path / FREEMOCAP_TEST_DATA_RECORDING_NAME
+
+        etag_path = figshare_sample_data_path / SAMPLE_DATA_ETAG_FILE_NAME
+        if remote_headers is None:
+            remote_headers = head_sample_data(sample_data_zip_file_url)
+        remote_fingerprint = get_remote_fingerprint(remote_headers)
+        if remote_fingerprint and etag_path.exists() and etag_path.read_text() == remote_fingerprint:
+            logger.info(f"Sample data at {str(figshare_sample_data_path)} is up to date, skipping download")
+            return str(figshare_sample_data_path)
+
+        logger.info(f"Downloading sample data from {sample_data_zip_file_url}...")
+        content_length = int(remote_headers.get("Content-Length") or 0)
+        accepts_ranges = remote_headers.get("Accept-Ranges", "").lower() == "bytes"
+        # both paths land the archive in one file on disk, so peak memory is a single chunk, not the whole zip
+        with tempfile.TemporaryDirectory() as temp_folder:
+            zip_file_path = Path(temp_folder) / "sample_data.zip"
+            if accepts_ranges and content_length >= MIN_RANGED_DOWNLOAD_SIZE_BYTES:
+                download_in_byte_ranges(sample_data_zip_file_url, zip_file_path, content_length)
+            else:
+                r = _SESSION.get(sample_data_zip_file_url, stream=True, timeout=(5, 60))
+                r.raise_for_status()  # Check if request was successful
+                with open(zip_file_path, "wb") as fh:
+                    for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
+                        fh.write(chunk)
+
+            with zipfile.ZipFile(zip_file_path) as z:
+                z.extractall(recording_session_folder_path)
+
+        if remote_fingerprint and figshare_sample_data_path.exists():
+            etag_path.write_text(remote_fingerprint)
         logger.info(f"Sample data extracted to {str(figshare_sample_data_path)}")
         return str(figshare_sample_data_path)
 
@@ -94,9 +199,16 @@ def download_sample_data(sample_data_zip_file_url: str = FIGSHARE_TEST_ZIP_FILE_
 from freemocap.core_processes.capture_volume_calibration.run_anipose_capture_volume_calibration import run_anipose_capture_volume_calibration
 
 
+@lru_cache(maxsize=None)
+def _default_charuco_board() -> CharucoBoardDefinition:
+    """Built once per process - constructing the board materializes the OpenCV aruco dictionary and board"""
+    return CharucoBoardDefinition()
+
+
 class SessionInfo:              # unchanged
     sample_session_folder_path: str
     recording_info_model: RecordingInfoModel
+    sync_video_folder: Path = None
 
 
 def setup_session() -> Path:
@@ -112,19 +224,20 @@ def setup_session() -> Path:
     SessionInfo.recording_info_model = RecordingInfoModel(
         recording_folder_path=SessionInfo.sample_session_folder_path,
     )
+    SessionInfo.sync_video_folder = Path(SessionInfo.recording_info_model.synchronized_videos_folder_path)
 
     logger.info("Running headless calibration…")
     toml_path = run_anipose_capture_volume_calibration(
         calibration_videos_folder_path=get_sync_video_folder(),
         charuco_square_size=58,
-        charuco_board_definition=CharucoBoardDefinition(),
+        charuco_board_definition=_default_charuco_board(),
         progress_callback=lambda _: None,  
     )
     return Path(toml_path)
 
 
 def get_sync_video_folder() -> Path:
-    return Path(SessionInfo.recording_info_model.synchronized_videos_folder_path)
+    return SessionInfo.sync_video_folder
 
 
 if __name__ == "__main__":
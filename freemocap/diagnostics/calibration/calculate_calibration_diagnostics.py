@@ -12,7 +12,9 @@ import csv
 def run(path_to_recording: Path):
     
     path_to_3d_data = path_to_recording/"output_data"/"charuco_3d_xyz.npy"
-    charuco_3d_data = np.load(path_to_3d_data)
+    # read once and downcast to float32 - on purpose: the stats are reported to 2 decimals on a ~58 mm square,
+    # fp64 buys nothing but twice the memory traffic in get_neighbor_distances, so don't "upgrade" this back
+    charuco_3d_data = np.load(path_to_3d_data).astype(np.float32, copy=False)
     csv_save_path= Path("data_current_calibration.csv")  
 
     path_to_json = path_to_recording/"charuco_board_info.json"
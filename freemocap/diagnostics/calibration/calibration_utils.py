@@ -1,8 +1,11 @@
 
 from skellytracker.trackers.charuco_tracker.charuco_model_info import CharucoTrackingParams, CharucoModelInfo
 from skellytracker.process_folder_of_videos import process_folder_of_videos
+from freemocap.utilities.get_video_paths import get_video_paths
 from pathlib import Path
-from typing import Union
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+import os
 import numpy as np
 from dataclasses import dataclass
 @dataclass
@@ -12,7 +15,15 @@ class CharucoNeighborStats:
     std_distance: float
     mean_error: float
 
-def get_charuco_2d_data(calibration_videos_folder_path: Union[str, Path], num_processes: int = 1):
+def get_charuco_2d_data(calibration_videos_folder_path: Union[str, Path], num_processes: Optional[int] = None):
+    """ Detect charuco corners in every video of the folder.
+
+    By default one worker process per video, capped at the number of cores - detection is
+    independent per video. Process startup overhead means this only pays off with 2+ videos.
+    """
+    if num_processes is None:
+        num_videos = len(get_video_paths(calibration_videos_folder_path))
+        num_processes = max(1, min(num_videos, os.cpu_count() or 1))
     return process_folder_of_videos(
         model_info=CharucoModelInfo(),
         tracking_params=CharucoTrackingParams(),
@@ -31,32 +42,30 @@ def get_charuco_neighbor_pairs(rows: int, cols: int):
                 neighbors.append((idx, idx + cols))   # bottom neighbor
     return neighbors
 
+@lru_cache(maxsize=None)
+def get_charuco_neighbor_pair_indices(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ Neighbor pairs split into two index arrays (cached - the board topology never changes within a run) """
+    neighbor_pairs = np.array(get_charuco_neighbor_pairs(rows, cols), dtype=np.intp).reshape(-1, 2)
+    idx_a, idx_b = neighbor_pairs[:, 0].copy(), neighbor_pairs[:, 1].copy()
+    idx_a.setflags(write=False)
+    idx_b.setflags(write=False)
+    return idx_a, idx_b
+
 def get_neighbor_distances(number_of_squares_width:int,
                            number_of_squares_height:int,
-                           charuco_3d_data:np.ndarray) -> list:
-    distances_per_frame = []
+                           charuco_3d_data:np.ndarray) -> np.ndarray:
+    """ Distances between neighboring charuco corners, shape (number of complete frames, number of neighbor pairs) """
     num_cols = number_of_squares_width - 1
     num_rows = number_of_squares_height - 1
 
-    neighbor_pairs = get_charuco_neighbor_pairs(num_rows, num_cols)
-
-    for frame_num in range(charuco_3d_data.shape[0]):
-        points_3d = charuco_3d_data[frame_num]
-
-        #skip frames with missing points
-        if np.isnan(points_3d).any():
-            continue
+    idx_a, idx_b = get_charuco_neighbor_pair_indices(num_rows, num_cols)
 
-        marker_distances = []
-        for i,j in neighbor_pairs:
-            pt1, pt2 = points_3d[i], points_3d[j]
-            if not np.isnan(pt1).any() and not np.isnan(pt2).any():
-                distance = np.linalg.norm(pt2 - pt1)
-                marker_distances.append(distance)
+    #skip frames with missing points
+    complete_frames = ~np.isnan(charuco_3d_data).any(axis=(1, 2))
+    points_3d = charuco_3d_data[complete_frames]
 
-        if marker_distances:
-            distances_per_frame.append(marker_distances)
-    return np.array(distances_per_frame, dtype=np.float64)
+    diffs = points_3d[:, idx_a, :] - points_3d[:, idx_b, :]
+    return np.sqrt(np.einsum("...i,...i->...", diffs, diffs))
 
 def get_neighbor_stats(distances:np.ndarray,
                        charuco_square_size_mm:float) -> dict:
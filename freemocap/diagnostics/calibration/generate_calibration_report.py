@@ -3,26 +3,54 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.io as pio
+from plotly.offline import get_plotlyjs
 from jinja2 import Template
 from packaging.version import parse as vparse, Version
+from functools import lru_cache
 import sys
 
+try:
+    # pandas' pyarrow CSV engine parses multithreaded in C++; the default C engine when pyarrow isn't installed
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 CURRENT_SENTINEL = Version("9999.0.0")
 EXPECTED = 58.0
 OS_ORDER = ["Windows", "macOS", "Linux"]
+# first version shown in the per-OS figures
+POST_MIN = vparse("1.6.0")
+# the only summary columns the report uses; mean_error is optional (derived when missing)
+REPORT_DTYPES = {
+    "os": "string",
+    "version": "string",
+    "mean_distance": "float32",
+    "std_distance": "float32",
+    "mean_error": "float32",
+}
+# part of the parquet cache file name - bump whenever read_summary_csv/prepare_summary_data change what they
+# produce, so a cache written by older code is never read back
+SUMMARY_CACHE_VERSION = 1
+# where load_summary_data looks for the summary CSV, in order
+SUMMARY_CSV_PATHS = [
+    Path("freemocap/diagnostics/diagnostic_data/calibration_diagnostics_summary.csv"),
+    Path("calibration_diagnostics_summary.csv"),
+    Path.cwd() / "freemocap/diagnostics/diagnostic_data/calibration_diagnostics_summary.csv",
+]
 
+@lru_cache(maxsize=None)
 def safe_parse(ver: str) -> Version:
-    """Parse semantic versions; return a giant sentinel for 'current'"""
+    """Parse semantic versions; return a giant sentinel for 'current' (cached - rows repeat versions across OSes)"""
     return CURRENT_SENTINEL if ver == "current" else vparse(ver)
 
-def load_summary_data():
+def version_keys(versions: pd.Series) -> pd.Series:
+    """safe_parse each distinct version once, then one dict lookup per row"""
+    key_map = {version: safe_parse(version) for version in versions.unique()}
+    return versions.map(key_map)
+
+def load_summary_data(possible_paths=SUMMARY_CSV_PATHS):
     # Try to find the CSV in multiple locations
-    possible_paths = [
-        Path("freemocap/diagnostics/diagnostic_data/calibration_diagnostics_summary.csv"),
-        Path("calibration_diagnostics_summary.csv"),
-        Path.cwd() / "freemocap/diagnostics/diagnostic_data/calibration_diagnostics_summary.csv",
-    ]
-    
     summary_csv = None
     for path in possible_paths:
         if path.exists():
@@ -36,37 +64,92 @@ def load_summary_data():
         sys.exit(1)
     
     print(f"Loading data from: {summary_csv}")
-    df = pd.read_csv(summary_csv)
-    
-    # Standardize OS names - remove any whitespace and fix case
-    df["os"] = df["os"].str.strip()
-    
-    # Add version_key for sorting
-    df["version_key"] = df["version"].apply(safe_parse)
-    
-    # Calculate mean_error if not present
-    if "mean_error" not in df.columns:
-        df["mean_error"] = df["mean_distance"] - EXPECTED
-    
-    # Sort by OS and version
-    df = df.sort_values(["os", "version_key"], ascending=[True, True])
-    
+
+    # prepared (stripped, categorical, sorted) frame cached next to the CSV while the CSV is unchanged.
+    # The cache is only an optimisation: no parquet engine, a truncated/corrupt file or a failed write
+    # all just mean reading the CSV
+    cache = summary_csv.with_name(f"{summary_csv.stem}.v{SUMMARY_CACHE_VERSION}.parquet")
+    if cache.exists() and cache.stat().st_mtime >= summary_csv.stat().st_mtime:
+        try:
+            df = pd.read_parquet(cache)
+        except ImportError:  # no parquet engine (pyarrow/fastparquet) installed
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable summary cache {cache} ({type(e).__name__}: {e})")
+        else:
+            # Version objects don't round-trip through parquet - rebuild them from the version strings
+            return df.assign(version_key=version_keys(df["version"]))
+
+    df = prepare_summary_data(read_summary_csv(summary_csv))
+    try:
+        df.drop(columns="version_key").to_parquet(cache)
+    except ImportError:  # no parquet engine (pyarrow/fastparquet) installed
+        pass
+    except Exception as e:
+        print(f"Could not write summary cache {cache} ({type(e).__name__}: {e})")
     return df
 
+def read_summary_csv(summary_csv: Path) -> pd.DataFrame:
+    """Read just the report columns, with their dtypes fixed up front instead of inferred"""
+    # the pyarrow engine only takes usecols as a list of existing columns (mean_error is optional) - peek at the header
+    header = pd.read_csv(summary_csv, nrows=0).columns
+    usecols = [column for column in header if column in REPORT_DTYPES]
+    dtype = {column: REPORT_DTYPES[column] for column in usecols}
+    return pd.read_csv(summary_csv, usecols=usecols, dtype=dtype, engine=CSV_ENGINE)
+
+def prepare_summary_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the derived columns the figures need to a raw summary frame (returns a new frame)"""
+    # Standardize OS names - remove any whitespace; as an ordered categorical so OS filters/groupbys
+    # compare integer codes and sort in OS_ORDER (unexpected names are kept, after the known ones)
+    os_names = df["os"].astype("string").str.strip()
+    extra_os_names = sorted(set(os_names.dropna()) - set(OS_ORDER))
+
+    # Calculate mean_error if not present - stays float32, like the other stats columns
+    derived = {} if "mean_error" in df.columns else {
+        "mean_error": lambda d: d["mean_distance"].astype("float32") - EXPECTED
+    }
+
+    # one chain instead of reassigning df per step: duplicates are removed on the stripped OS names, then
+    # version_key (and mean_error) are added in a single assign on the deduplicated rows
+    return (
+        df.assign(os=pd.Categorical(os_names, categories=OS_ORDER + extra_os_names, ordered=True))
+        .drop_duplicates(subset=["os", "version"], keep="last")
+        .assign(version_key=lambda d: version_keys(d["version"]), **derived)
+        # Sort by OS and version
+        .sort_values(["os", "version_key"], ascending=[True, True])
+    )
+
 def generate_figures(df):
     OS_COLORS = {
     "Windows": "rgb(0, 114, 178)",    # blue
     "macOS":   "rgb(213, 94, 0)",     # vermilion
     "Linux":   "rgb(0, 158, 115)",    # bluish green
 }
+    if df.empty:
+        print("WARNING: No data for figures!")
+        return go.Figure(), go.Figure(), go.Figure()
+
+    # Sort once and partition by OS once; each group keeps the version order for every figure below
+    df = df.sort_values("version_key", kind="stable")
+    # "current" parses to CURRENT_SENTINEL, so it is always included
+    post = df[df["version_key"] >= POST_MIN]
+    no_rows = df.iloc[:0]
+    df_by_os = dict(iter(df.groupby("os", sort=False, observed=True)))
+    post_by_os = dict(iter(post.groupby("os", sort=False, observed=True)))
+    # explicit x-axis order - plotly would otherwise order categories by first appearance across traces
+    sorted_versions = df["version"].unique().tolist()
+    post_versions = post["version"].unique().tolist()
+
+    # Traces and layouts below are plain dicts, each figure is built once with _validate=False and not
+    # mutated afterwards - graph_objects validation/deepcopy per trace and per update call is most of the cost otherwise
+
     # Figure 1 – All OS mean distance over all versions
-    fig1 = go.Figure()
+    traces = []
     
     print("\n=== FIGURE 1 DATA ===")
     
     for os_name in OS_ORDER:
-        # Try exact match first
-        os_df = df[df["os"] == os_name].sort_values("version_key")
+        os_df = df_by_os.get(os_name, no_rows)
         
         print(f"\n{os_name}: {len(os_df)} data points")
         
@@ -74,47 +157,71 @@ def generate_figures(df):
             print(f"  Versions: {list(os_df['version'])}")
             print(f"  Values: {list(os_df['mean_distance'])}")
             
-            fig1.add_scatter(
-                x=os_df["version"], 
-                y=os_df["mean_distance"],
+            traces.append(dict(
+                type="scatter",
+                x=os_df["version"].to_numpy(), 
+                y=os_df["mean_distance"].to_numpy(),
                 mode="lines+markers", 
                 name=os_name,
+                connectgaps=True,
                 line=dict(width=2),
                 marker=dict(size=8, color=OS_COLORS.get(os_name, "gray"))
-            )
-    
-    fig1.add_hline(y=EXPECTED, line_dash="dash", line_color="black", 
-                   annotation_text="Expected size", annotation_position="top right")
+            ))
     
-    fig1.update_layout(
-        title="Mean Charuco Square Size (mm) – all operating systems",
-        yaxis_title="Square Size Estimate (mm)",
-        xaxis_title="FreeMoCap Version",
-        title_font=dict(size=20),
-        xaxis_title_font=dict(size=22),
-        yaxis_title_font=dict(size=20),
-        xaxis_tickfont=dict(size=16),
-        yaxis_tickfont=dict(size=18),
-        height=500,
-        showlegend=True,
-        legend=dict(x=0.02, y=0.98, xanchor="left", yanchor="top")
+    fig1 = go.Figure(
+        data=traces,
+        layout=dict(
+            title=dict(text="Mean Charuco Square Size (mm) – all operating systems", font=dict(size=20)),
+            xaxis=dict(
+                title=dict(text="FreeMoCap Version", font=dict(size=22)),
+                tickfont=dict(size=16),
+                type="category",
+                categoryorder="array",
+                categoryarray=sorted_versions,
+            ),
+            yaxis=dict(
+                title=dict(text="Square Size Estimate (mm)", font=dict(size=20)),
+                tickfont=dict(size=18),
+            ),
+            height=500,
+            showlegend=True,
+            legend=dict(x=0.02, y=0.98, xanchor="left", yanchor="top"),
+            # expected line + its label, what add_hline(annotation_position="top right") would add
+            shapes=[dict(
+                type="line",
+                x0=0, x1=1, xref="x domain",
+                y0=EXPECTED, y1=EXPECTED, yref="y",
+                line=dict(dash="dash", color="black")
+            )],
+            annotations=[dict(
+                text="Expected size", showarrow=False,
+                x=1, xref="x domain", xanchor="right",
+                y=EXPECTED, yref="y", yanchor="bottom"
+            )],
+        ),
+        _validate=False,
     )
 
     # Figure 2 – Per OS, post-1.6.0
     print("\n=== FIGURE 2 DATA ===")
     
-    # Filter for versions >= 1.6.0 (including "current")
-    post = df[(df["version_key"] >= vparse("1.6.0")) | (df["version"] == "current")]
+    # versions >= 1.6.0 (including "current"), filtered above
     print(f"Post-1.6.0 data: {len(post)} rows")
     print(f"OS distribution: {post['os'].value_counts().to_dict()}")
     
-    fig2 = make_subplots(rows=1, cols=3, shared_yaxes=True, 
-                         subplot_titles=OS_ORDER,
-                         horizontal_spacing=0.1)
+    # make_subplots only provides the layout skeleton: subplot axis domains and the subplot title annotations
+    layout = make_subplots(rows=1, cols=3, shared_yaxes=True, 
+                           subplot_titles=OS_ORDER,
+                           horizontal_spacing=0.1).layout.to_plotly_json()
+    # value labels are collected after the subplot titles and the list is set once
+    annotations = list(layout["annotations"])
+    shapes = []
+    traces = []
     
     for col, os_name in enumerate(OS_ORDER, start=1):
-        # Get data for this OS and sort by version
-        os_data = post[post["os"] == os_name].sort_values("version_key")
+        # Get data for this OS (already in version order)
+        os_data = post_by_os.get(os_name, no_rows)
+        axis_suffix = "" if col == 1 else str(col)
         
         print(f"\n{os_name} (subplot {col}): {len(os_data)} points")
         if len(os_data) > 0:
@@ -122,13 +229,14 @@ def generate_figures(df):
             print(f"  Values: {list(os_data['mean_distance'])}")
         
         if len(os_data) > 0:
-            # Add scatter plot with error bars
-            fig2.add_scatter(
-                x=os_data["version"], 
-                y=os_data["mean_distance"],
+            # Add scatter plot with error bars (WebGL - one draw call instead of an SVG node per marker)
+            traces.append(dict(
+                type="scattergl",
+                x=os_data["version"].to_numpy(), 
+                y=os_data["mean_distance"].to_numpy(),
                 error_y=dict(
                     type='data', 
-                    array=os_data["std_distance"], 
+                    array=os_data["std_distance"].to_numpy(), 
                     visible=True,
                     width=4,
                     thickness=2
@@ -136,162 +244,186 @@ def generate_figures(df):
                 mode="markers", 
                 marker=dict(size=10,  color=OS_COLORS.get(os_name, "gray")),
                 showlegend=False, 
-                row=1, 
-                col=col
-            )
+                xaxis=f"x{axis_suffix}",
+                yaxis=f"y{axis_suffix}"
+            ))
             
-            # Add value annotations
-            for _, row in os_data.iterrows():
-                fig2.add_annotation(
-                    x=row["version"], 
-                    y=row["mean_distance"] + row["std_distance"] + 0.3,
-                    text=f"{row['mean_distance']:.2f}±{row['std_distance']:.2f}", 
+            # Add value annotations - columns pulled out as arrays once, label heights in one vector op
+            versions = os_data["version"].to_numpy()
+            means = os_data["mean_distance"].to_numpy(dtype="float64")
+            stds = os_data["std_distance"].to_numpy(dtype="float64")
+            label_ys = means + stds + 0.3
+            annotations.extend(
+                dict(
+                    x=version,
+                    y=label_y,
+                    xref=f"x{axis_suffix}",
+                    yref=f"y{axis_suffix}",
+                    text=f"{mean:.2f}±{std:.2f}",
                     showarrow=False,
-                    yanchor="bottom", 
-                    row=1, 
-                    col=col,
+                    yanchor="bottom",
                     font=dict(size=10)
                 )
+                for version, label_y, mean, std in zip(versions.tolist(), label_ys.tolist(), means.tolist(), stds.tolist())
+            )
         
         # Add expected line
-        fig2.add_hline(y=EXPECTED, line_dash="dash", line_color="black", 
-                       row=1, col=col)
+        shapes.append(dict(
+            type="line",
+            x0=0, x1=1, xref=f"x{axis_suffix} domain",
+            y0=EXPECTED, y1=EXPECTED, yref=f"y{axis_suffix}",
+            line=dict(color="black", dash="dash")
+        ))
         
-        # Update x-axis
-        fig2.update_xaxes(
+        # x-axis per subplot
+        layout[f"xaxis{axis_suffix}"].update(
             tickfont=dict(size=14),
-            title_font=dict(size=16),
-            title_text="Version",
-            row=1, col=col
+            title=dict(text="Version", font=dict(size=16)),
+            type="category",
+            categoryorder="array",
+            categoryarray=post_versions,
         )
     
-    # Update y-axis (only for first subplot)
-    fig2.update_yaxes(
+    # y-axis (only for first subplot, the others share it)
+    layout["yaxis"].update(
         tickfont=dict(size=14),
-        title_font=dict(size=16),
-        title_text="Square-size estimate (mm)",
+        title=dict(text="Square-size estimate (mm)", font=dict(size=16)),
         range=[EXPECTED - 3, EXPECTED + 3],
-        row=1, col=1
     )
     
-    fig2.update_layout(
-        title="Charuco Square Size Estimate – versions ≥ 1.6.0",
-        title_font=dict(size=20),
+    layout.update(
+        annotations=annotations,
+        shapes=shapes,
+        title=dict(text="Charuco Square Size Estimate – versions ≥ 1.6.0", font=dict(size=20)),
         height=400
     )
+    # built from plain dicts there is no subplot grid for add_hline(row=, col=), hence the shapes above
+    fig2 = go.Figure(data=traces, layout=layout, _validate=False)
 
     # Figure 3 – Mean error plot
     print("\n=== FIGURE 3 DATA ===")
     
-    fig3 = go.Figure()
+    # plain (versions, errors) arrays per OS, taken from the partition above
+    err_by_os = {
+        name: (group["version"].to_numpy(), group["mean_error"].to_numpy())
+        for name, group in post_by_os.items()
+    }
+    traces = []
     
     for os_name in OS_ORDER:
-        os_data = post[post["os"] == os_name].sort_values("version_key")
+        versions, errors = err_by_os.get(os_name, ((), ()))
         
-        print(f"\n{os_name}: {len(os_data)} points")
-        if len(os_data) > 0:
-            print(f"  Versions: {list(os_data['version'])}")
-            print(f"  Errors: {list(os_data['mean_error'])}")
+        print(f"\n{os_name}: {len(versions)} points")
+        if len(versions) > 0:
+            print(f"  Versions: {list(versions)}")
+            print(f"  Errors: {errors.tolist()}")
         
-        if len(os_data) > 0:
-            fig3.add_trace(go.Scatter(
-                x=os_data["version"], 
-                y=os_data["mean_error"],
+        if len(versions) > 0:
+            traces.append(dict(
+                type="scattergl",
+                x=versions, 
+                y=errors,
                 mode="lines+markers", 
                 name=os_name,
+                connectgaps=True,
                 line=dict(width=2),
                 marker=dict(size=8, color=OS_COLORS.get(os_name, "gray"))
             ))
     
-    fig3.add_hline(y=0, line_dash="dot", line_color="gray", 
-                   annotation_text="No error", annotation_position="top right")
-    
-    fig3.update_layout(
-        title="Mean Error in Square Size Estimate (Post v1.6.0)",
-        yaxis_title="Mean error (mm)", 
-        xaxis_title="FreeMoCap version",
-        height=400,
-        xaxis_title_font=dict(size=22),
-        yaxis_title_font=dict(size=20),
-        xaxis_tickfont=dict(size=16),
-        yaxis_tickfont=dict(size=18),
-        showlegend=True,
-        legend=dict(x=0.02, y=0.98, xanchor="left", yanchor="top"),
-    )
-    fig3.update_yaxes(
-        range=[-.5, .5],
+    fig3 = go.Figure(
+        data=traces,
+        layout=dict(
+            title=dict(text="Mean Error in Square Size Estimate (Post v1.6.0)"),
+            xaxis=dict(
+                title=dict(text="FreeMoCap version", font=dict(size=22)),
+                tickfont=dict(size=16),
+                type="category",
+                categoryorder="array",
+                categoryarray=post_versions,
+            ),
+            yaxis=dict(
+                title=dict(text="Mean error (mm)", font=dict(size=20)),
+                tickfont=dict(size=18),
+                range=[-.5, .5],
+            ),
+            height=400,
+            showlegend=True,
+            legend=dict(x=0.02, y=0.98, xanchor="left", yanchor="top"),
+            # zero-error line + its label
+            shapes=[dict(
+                type="line",
+                x0=0, x1=1, xref="x domain",
+                y0=0, y1=0, yref="y",
+                line=dict(dash="dot", color="gray")
+            )],
+            annotations=[dict(
+                text="No error", showarrow=False,
+                x=1, xref="x domain", xanchor="right",
+                y=0, yref="y", yanchor="bottom"
+            )],
+        ),
+        _validate=False,
     )
+    
     return fig1, fig2, fig3
 
 def generate_summary_table(df):
     print("\n=== TABLE DATA ===")
     
     # Get the latest data for each OS (highest version_key)
-    latest = df.sort_values("version_key", ascending=False).groupby("os").first().reset_index()
+    latest = df.loc[df.groupby("os", sort=False, observed=True)["version_key"].idxmax()].set_index("os")
     
     print("Latest data per OS:")
-    print(latest[["os", "version", "mean_distance", "std_distance", "mean_error"]].to_string())
+    print(latest.reset_index()[["os", "version", "mean_distance", "std_distance", "mean_error"]].to_string())
     
-    # Create ordered dataframe
-    ordered_latest = pd.DataFrame()
-    for os_name in OS_ORDER:
-        os_row = latest[latest["os"] == os_name]
-        if len(os_row) > 0:
-            ordered_latest = pd.concat([ordered_latest, os_row])
-    
-    if len(ordered_latest) == 0:
+    if len(latest) == 0:
         print("WARNING: No data for table!")
-        ordered_latest = pd.DataFrame({
-            "os": OS_ORDER,
-            "mean_distance": [0, 0, 0],
-            "std_distance": [0, 0, 0],
-            "mean_error": [0, 0, 0]
-        })
-    
-    table = go.Figure(data=[go.Table(
-        header=dict(
-            values=["OS", "Mean Square Size ± SD (mm)", "Mean Error (mm)"],
-            fill_color='lightgray',
-            align='center',
-            font=dict(size=18)
-        ),
-        cells=dict(
-            values=[
-                ordered_latest["os"],
-                [f"{m:.2f} ± {s:.2f}" for m, s in zip(ordered_latest["mean_distance"], ordered_latest["std_distance"])],
-                [f"{e:.2f}" for e in ordered_latest["mean_error"]]
-            ],
-            align="center",
-            font=dict(size=16),
-            height=30,
-            fill_color='#f8f9fa'
-        )
-    )])
     
-    table.update_layout(
-        title="Latest Calibration Summary (per OS)",
-        margin=dict(t=60, l=0, r=0),
-        height=250
+    # Create ordered dataframe - an OS without data is left out rather than shown as a (perfect-looking) zero row
+    ordered_latest = (
+        latest[["mean_distance", "std_distance", "mean_error"]]
+        .reindex(pd.Index(OS_ORDER, name="os"))
+        .dropna(how="all")
+        .reset_index()
     )
     
-    return table
+    # static data - a plain HTML table needs no plotly div for the browser to hydrate
+    summary = pd.DataFrame({
+        "OS": ordered_latest["os"].astype(str),
+        # .astype(str): with no rows left .map returns float64, which can't be concatenated with " ± "
+        "Mean Square Size ± SD (mm)": ordered_latest["mean_distance"].map("{:.2f}".format).astype(str) + " ± " + ordered_latest["std_distance"].map("{:.2f}".format).astype(str),
+        "Mean Error (mm)": ordered_latest["mean_error"].map("{:.2f}".format).astype(str),
+    })
+    
+    return summary.to_html(index=False, border=0, classes="summary-table", justify="center")
 
-def generate_html_report(df, output_path="freemocap/diagnostics/calibration_diagnostics.html"):
-    fig1, fig2, fig3 = generate_figures(df)
-    table = generate_summary_table(df)
+def fig_to_div(fig, div_id: str) -> str:
+    """Figure as a bare div + Plotly.newPlot call (skips to_html's re-validation and wrapper)"""
+    # "</" escaped so strings in the JSON can never close the <script> early
+    figure_json = pio.to_json(fig, validate=False).replace("</", "<\\/")
+    # sized like to_html does: the layout height when there is one
+    height = f"{fig.layout.height}px" if fig.layout.height else "100%"
+    return (
+        f'<div id="{div_id}" class="plotly-graph-div" style="height:{height}; width:100%;"></div>'
+        f'<script>(function (figure) {{ Plotly.newPlot("{div_id}", figure.data, figure.layout, {{responsive: true}}); }})({figure_json});</script>'
+    )
 
-    template = Template("""
+# compiled once at import rather than on every report
+_REPORT_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset='utf-8'>
         <title>Calibration Diagnostics Report</title>
-        <script src='https://cdn.plot.ly/plotly-latest.min.js'></script>
+        <script>{{ plotly_js|safe }}</script>
         <style>
             body { font-family: Arial, sans-serif; margin: 40px; }
             h1 { color: #333; }
             .plot-container { margin: 20px 0; }
             pre { background: #f0f0f0; padding: 10px; overflow-x: auto; }
+            .summary-table { width: 100%; border-collapse: collapse; text-align: center; }
+            .summary-table th { background: lightgray; font-size: 18px; padding: 6px; }
+            .summary-table td { background: #f8f9fa; font-size: 16px; height: 30px; border-top: 1px solid white; }
         </style>
     </head>
     <body>
@@ -315,32 +447,44 @@ def generate_html_report(df, output_path="freemocap/diagnostics/calibration_diag
     </html>
     """)
 
-    # Capture debug info
-    import io
-    import sys
-    old_stdout = sys.stdout
-    sys.stdout = buffer = io.StringIO()
-    
-    # Re-run data loading to capture debug output
-    _ = load_summary_data()
-    
-    debug_output = buffer.getvalue()
-    sys.stdout = old_stdout
-
-    rendered = template.render(
-        fig1=pio.to_html(fig1, include_plotlyjs=False, full_html=False),
-        fig2=pio.to_html(fig2, include_plotlyjs=False, full_html=False),
-        fig3=pio.to_html(fig3, include_plotlyjs=False, full_html=False),
-        table=pio.to_html(table, include_plotlyjs=False, full_html=False),
-        expected=EXPECTED,
-        debug_info=debug_output
-    )
-
+def generate_html_report(df, output_path="freemocap/diagnostics/calibration_diagnostics.html"):
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(rendered, encoding="utf-8")
+
+    # nothing to plot - a stub page instead of three empty figures and the whole inlined plotly.js
+    if df.empty:
+        output_file.write_text(
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Calibration Diagnostics Report</title></head>"
+            "<body><h1>No calibration data</h1></body></html>",
+            encoding="utf-8",
+        )
+        print(f"\n⚠️ No calibration data - placeholder report written to: {output_file.absolute()}")
+        return
+
+    fig1, fig2, fig3 = generate_figures(df)
+    table = generate_summary_table(df)
+
+    template = _REPORT_TEMPLATE
+
+    figures = {"fig1": fig1, "fig2": fig2, "fig3": fig3}
+    figure_divs = {name: fig_to_div(fig, div_id=name) for name, fig in figures.items()}
+
+    # stream the page to disk chunk by chunk rather than building the whole document as one string first;
+    # the 1 MiB buffer batches the many small template chunks into few write calls
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        template.stream(
+            **figure_divs,
+            table=table,
+            expected=EXPECTED,
+            # the bundled plotly.js, inlined once for the whole page - no CDN fetch, works offline
+            plotly_js=get_plotlyjs(),
+        ).dump(fh)
     print(f"\n✅ Calibration report written to: {output_file.absolute()}")
 
+def generate(df: pd.DataFrame, out_html: Path):
+    """Build the report straight from an in-memory summary frame (e.g. the one merge_calibration_data.py just wrote)"""
+    generate_html_report(prepare_summary_data(df), output_path=out_html)
+
 if __name__ == "__main__":
     df = load_summary_data()
     generate_html_report(df)
\ No newline at end of file
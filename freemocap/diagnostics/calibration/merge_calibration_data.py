@@ -1,8 +1,23 @@
 from pathlib import Path
+import csv
 import pandas as pd
-import subprocess
 import sys
 
+# sibling module - this script's folder is on sys.path when it is run directly
+from generate_calibration_report import generate
+
+# fixed summary schema - passing it to read_csv skips pandas' dtype inference pass.
+# The stats stay float64: this frame is written back to the committed summary CSV, so anything
+# narrower would round the whole history on every merge
+SUMMARY_DTYPES = {
+    "os": "category",
+    "version": "string",
+    "mean_distance": "float64",
+    "median_distance": "float64",
+    "std_distance": "float64",
+    "mean_error": "float64",
+}
+
 # repo root = three levels up from this script
 repo_root = Path(__file__).resolve().parents[3]
 print("🧭 repo_root =", repo_root)
@@ -11,35 +26,34 @@ summary_csv = repo_root / "freemocap/diagnostics/diagnostic_data/calibration_dia
 collected = Path("collected")  # where download-artifact puts the CSVs
 # 1) load existing summary
 if summary_csv.exists():
-    full_df = pd.read_csv(summary_csv)
+    full_df = pd.read_csv(summary_csv, dtype=SUMMARY_DTYPES, engine="c")
     print(f"Loaded existing summary with {len(full_df)} rows")
 else:
     # Create empty dataframe with expected columns if file doesn't exist
-    full_df = pd.DataFrame(columns=["os", "version", "mean_distance", "median_distance", "std_distance", "mean_error"])
+    full_df = pd.DataFrame(columns=list(SUMMARY_DTYPES)).astype(SUMMARY_DTYPES)
     print("Created new summary dataframe")
 
-# 2) ingest rows
-csv_files = list(collected.glob("**/*.csv"))
-print(f"Found {len(csv_files)} CSV files to merge:")
-for f in csv_files:
-    print(f"  - {f}")
-
-if not csv_files:
-    sys.exit("❌ No calibration rows found in ./collected")
-
+# 2) ingest rows - a single walk over ./collected that lists and reads each file as it is found.
+# Each artifact is a one-row CSV, so read them as plain dicts and build a single DataFrame at the end
 rows = []
-for f in csv_files:
+num_csv_files = 0
+print("Merging CSV files:")
+for f in collected.rglob("*.csv"):
+    num_csv_files += 1
+    print(f"  - {f}")
     try:
-        df = pd.read_csv(f)
+        with open(f, newline="") as fh:
+            reader = csv.DictReader(fh)
+            file_rows = list(reader)
         print(f"\n  Reading {f.name}:")
-        print(f"    Shape: {df.shape}")
-        print(f"    Columns: {list(df.columns)}")
-        if len(df) > 0:
+        print(f"    Rows: {len(file_rows)}")
+        print(f"    Columns: {reader.fieldnames}")
+        if file_rows:
             print(f"    First row:")
-            print(f"      OS: '{df.iloc[0]['os']}'")
-            print(f"      Version: '{df.iloc[0]['version']}'")
-            print(f"      Mean distance: {df.iloc[0]['mean_distance']}")
-        rows.append(df)
+            print(f"      OS: '{file_rows[0]['os']}'")
+            print(f"      Version: '{file_rows[0]['version']}'")
+            print(f"      Mean distance: {file_rows[0]['mean_distance']}")
+        rows.extend(file_rows)
     except Exception as e:
         print(f"  Error reading {f}: {e}")
         # Try to read raw content
@@ -50,10 +64,16 @@ for f in csv_files:
         except:
             pass
 
+print(f"Found {num_csv_files} CSV files to merge")
+if not num_csv_files:
+    sys.exit("❌ No calibration rows found in ./collected")
+
 if not rows:
     sys.exit("❌ No valid CSV data found")
 
-new_df = pd.concat(rows, ignore_index=True)
+new_df = pd.DataFrame(rows)
+# DictReader yields strings; cast to the same schema as the summary
+new_df = new_df.astype({column: dtype for column, dtype in SUMMARY_DTYPES.items() if column in new_df.columns})
 print(f"\nCombined into {len(new_df)} new rows")
 print(f"New data preview:")
 print(new_df.to_string())
@@ -61,13 +81,16 @@ print(new_df.to_string())
 # Standardize OS names
 new_df["os"] = new_df["os"].str.strip()
 
-# 3) replace old 'current' rows and save
-full_df = full_df[full_df["version"] != "current"]
-full_df = pd.concat([full_df, new_df], ignore_index=True)
-
 # Ensure OS names are standardized
 full_df["os"] = full_df["os"].str.strip()
 
+# 3) replace old 'current' rows (and any os/version being re-submitted) via hashed (os, version) index lookups
+full_df = full_df.set_index(["os", "version"])
+new_df = new_df.set_index(["os", "version"])
+full_df = full_df.drop(index="current", level="version", errors="ignore")
+full_df = full_df.drop(index=new_df.index, errors="ignore")
+full_df = pd.concat([full_df, new_df]).reset_index()
+
 # Remove duplicates - keep only the latest entry for each os/version combination
 print(f"Before deduplication: {len(full_df)} rows")
 full_df = full_df.drop_duplicates(subset=['os', 'version'], keep='last')
@@ -87,17 +110,9 @@ summary_csv.parent.mkdir(parents=True, exist_ok=True)
 full_df.to_csv(summary_csv, index=False)
 print(f"✅ Summary updated: {summary_csv}")
 
-# 4) regenerate HTML
-report_script = repo_root / "freemocap/diagnostics/calibration/generate_calibration_report.py"
-if report_script.exists():
-    print(f"Running report generation script: {report_script}")
-    result = subprocess.run([sys.executable, str(report_script)], capture_output=True, text=True)
-    print("STDOUT:", result.stdout)
-    if result.stderr:
-        print("STDERR:", result.stderr)
-    if result.returncode != 0:
-        sys.exit(f"Report generation failed with code {result.returncode}")
-else:
-    print(f"⚠️ Report script not found at {report_script}")
-    
+# 4) regenerate HTML in-process from the merged frame (no second interpreter, no CSV re-read)
+report_html = repo_root / "freemocap/diagnostics/calibration_diagnostics.html"
+print(f"Generating report: {report_html}")
+generate(full_df, report_html)
+
 print("🎉 Process complete!")
\ No newline at end of file
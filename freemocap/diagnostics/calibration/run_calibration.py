@@ -49,21 +49,24 @@ def setup_session():
         board_info = json.load(fh)
 
     charuco_square_size = board_info["square_size_mm"]
+    # built/resolved once and shared by the calibration and the 2d detection below
+    charuco_board_definition = CharucoBoardDefinition()
+    synchronized_video_folder_path = get_synchronized_video_folder_path()
     calibration_toml_path = run_anipose_capture_volume_calibration(
-        charuco_board_definition=CharucoBoardDefinition(),
-        calibration_videos_folder_path=get_synchronized_video_folder_path(),
+        charuco_board_definition=charuco_board_definition,
+        calibration_videos_folder_path=synchronized_video_folder_path,
         charuco_square_size=charuco_square_size,
         progress_callback= lambda _: None) 
     
     charuco_2d_xy = get_charuco_2d_data(
-        calibration_videos_folder_path=get_synchronized_video_folder_path(),
-        num_processes=3
+        calibration_videos_folder_path=synchronized_video_folder_path,
     )
 
     logger.info("Charuco 2d data detected successfully with shape: "
             f"{charuco_2d_xy.shape}")
 
-    charuco_2d_xy = charuco_2d_xy.astype(np.float64)
+    # no copy when the detector already returns contiguous float64
+    charuco_2d_xy = np.ascontiguousarray(charuco_2d_xy, dtype=np.float64)
 
     logger.info("Getting 3d Charuco data")
     anipose_calibration_object = freemocap_anipose.CameraGroup.load(str(calibration_toml_path))
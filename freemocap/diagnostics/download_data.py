@@ -1,5 +1,5 @@
-import io
 import logging
+import tempfile
 import zipfile
 from pathlib import Path
 
@@ -9,6 +9,8 @@ from freemocap.system.paths_and_filenames.path_getters import get_recording_sess
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE_BYTES = 1 << 20
+
 
 @dataclass 
 class Sample:
@@ -31,13 +33,20 @@ def download_data(zip_file_url) -> str:
         logger.info(f"Downloading data from {zip_file_url}...")
         recording_session_folder_path = Path(get_recording_session_folder_path())
         recording_session_folder_path.mkdir(parents=True, exist_ok=True)
-        r = requests.get(zip_file_url, stream=True, timeout=(5, 60))
-        r.raise_for_status()
+        # stream the archive to a temp file so peak memory is one chunk, not the whole zip
+        with tempfile.TemporaryDirectory() as temp_folder:
+            zip_file_path = Path(temp_folder) / "data.zip"
+            r = requests.get(zip_file_url, stream=True, timeout=(5, 60))
+            r.raise_for_status()
+            with open(zip_file_path, "wb") as fh:
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
+                    fh.write(chunk)
 
-        z = zipfile.ZipFile(io.BytesIO(r.content))
-        z.extractall(recording_session_folder_path)
+            with zipfile.ZipFile(zip_file_path) as z:
+                z.extractall(recording_session_folder_path)
+                zip_entry_names = z.namelist()
 
-        recording_name = {Path(p).parts[0] for p in z.namelist() if not p.endswith("/")} #gets name of recording (top-level folder in zip file)
+        recording_name = {Path(p).parts[0] for p in zip_entry_names if not p.endswith("/")} #gets name of recording (top-level folder in zip file)
         if len(recording_name) != 1:
             raise ValueError(f"{zip_file_url!r} contained {len(recording_name)} top-level entries: {recording_name}")
 
@@ -15,11 +15,15 @@ Uses a fixed board:  7 × 5 squares, square-size 58 mm.
 ----------------------------------------------------------------
 """
 from __future__ import annotations
-import csv, json, logging, re, shutil
+import csv, json, logging, os, re, shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
+import pandas as pd
 
 from freemocap.utilities.download_sample_data import download_sample_data
 from freemocap.data_layer.recording_models.recording_info_model import RecordingInfoModel
@@ -50,12 +54,14 @@ BOARD_SQUARE_SIZE_MM = 58
 BOARD_NUM_WIDTH  = 7
 BOARD_NUM_HEIGHT = 5
 
+_FNAME_RE = re.compile(r"calibration_(.+)_(\d+\.\d+\.\d+)\.toml$")
+
 
 def _parse_filename(toml_path: Path) -> tuple[str, str]:
     """
     Parse 'calibration_<OS>_<version>.toml' → ("Windows", "1.5.4")
     """
-    m = re.match(r"calibration_(.+)_(\d+\.\d+\.\d+)\.toml$", toml_path.name)
+    m = _FNAME_RE.match(toml_path.name)
     if not m:
         raise ValueError(f"Unexpected file name: {toml_path.name}")
     return m.group(1), m.group(2)
@@ -65,6 +71,72 @@ def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _process_one_toml(
+    toml_path: Path,
+    shm_name: str,
+    shape: Tuple[int, ...],
+    dtype: str,
+    output_root: Path,
+) -> Dict[str, str | float]:
+    """
+    Triangulate the shared 2-D corners with one calibration toml, save its
+    outputs and return its summary row (runs in a worker process).
+    """
+    os_name, version = _parse_filename(toml_path)
+    log.info(f"Processing {toml_path.name} …")
+
+    # Output layout
+    run_out = output_root / os_name / version
+    _ensure_dir(run_out / "output_data")
+
+    # a) copy the toml for traceability
+    shutil.copy2(toml_path, run_out / "calibration.toml")
+
+    shm = SharedMemory(name=shm_name)
+    try:
+        # read-only view - every worker reads the same buffer
+        charuco_2d_xy = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        charuco_2d_xy.setflags(write=False)
+
+        # b) Triangulate 3-D
+        calib = freemocap_anipose.CameraGroup.load(str(toml_path))
+        data_3d, *_ = triangulate_3d_data(
+            anipose_calibration_object=calib,
+            image_2d_data=charuco_2d_xy,
+        )
+        del charuco_2d_xy  # drop the view before closing the block
+    finally:
+        shm.close()
+
+    npy_path = run_out / "output_data" / "charuco_3d_xyz.npy"
+    np.save(npy_path, data_3d)
+
+    # c) Statistics
+    distances = get_neighbor_distances(
+        charuco_3d_data           = data_3d,
+        number_of_squares_width   = BOARD_NUM_WIDTH,
+        number_of_squares_height  = BOARD_NUM_HEIGHT,
+    )
+    stats = asdict(                # <- change here
+        get_neighbor_stats(
+            distances             = distances,
+            charuco_square_size_mm= BOARD_SQUARE_SIZE_MM,
+        )
+    )
+
+    # d) Save per-run CSV
+    csv_path = run_out / "charuco_3d_stats.csv"
+    with open(csv_path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=stats.keys())
+        writer.writeheader()
+        writer.writerow(stats)
+
+    # e) Summary row
+    row: Dict[str, str | float] = {"os": os_name, "version": version}
+    row.update(stats)
+    return row
+
+
 # --------------------------------------------------------------------
 # Main public helper
 # --------------------------------------------------------------------
@@ -103,71 +175,47 @@ def build_calibration_dataset(
     log.info("Detecting Charuco corners (2-D) …")
     charuco_2d_xy = get_charuco_2d_data(
         calibration_videos_folder_path=Path(model.synchronized_videos_folder_path),
-        num_processes=3,
-    ).astype(np.float64)
+    )
+    # no copy when the detector already returns contiguous float64
+    charuco_2d_xy = np.ascontiguousarray(charuco_2d_xy, dtype=np.float64)
+    if charuco_2d_xy.size == 0:
+        # nothing to triangulate - and a zero-byte SharedMemory below would fail with an unhelpful ValueError
+        raise ValueError(
+            f"No Charuco corners detected in {model.synchronized_videos_folder_path} "
+            f"(2-D data shape {charuco_2d_xy.shape}) - check the sample data at {session_path}"
+        )
 
     # ----------------------------------------------------------------
-    # 2. Iterate over every calibration toml
+    # 2. Triangulate every calibration toml (independent - one worker process each, up to the core count)
     # ----------------------------------------------------------------
-    summary_rows: List[Dict[str, str | float]] = []
-
-    for toml_path in sorted(calibration_folder.glob("calibration_*.toml")):
-        os_name, version = _parse_filename(toml_path)
-        log.info(f"Processing {toml_path.name} …")
-
-        # Output layout
-        run_out = output_root / os_name / version
-        _ensure_dir(run_out / "output_data")
-
-        # a) copy the toml for traceability
-        shutil.copy2(toml_path, run_out / "calibration.toml")
-
-        # b) Triangulate 3-D
-        calib = freemocap_anipose.CameraGroup.load(str(toml_path))
-        data_3d, *_ = triangulate_3d_data(
-            anipose_calibration_object=calib,
-            image_2d_data=charuco_2d_xy,
-        )
-        npy_path = run_out / "output_data" / "charuco_3d_xyz.npy"
-        np.save(npy_path, data_3d)
-
-        # c) Statistics
-        distances = get_neighbor_distances(
-            charuco_3d_data           = data_3d,
-            number_of_squares_width   = BOARD_NUM_WIDTH,
-            number_of_squares_height  = BOARD_NUM_HEIGHT,
-        )
-        stats = asdict(                # <- change here
-            get_neighbor_stats(
-                distances             = distances,
-                charuco_square_size_mm= BOARD_SQUARE_SIZE_MM,
-            )
-        )
-
-        # d) Save per-run CSV
-        csv_path = run_out / "charuco_3d_stats.csv"
-        with open(csv_path, "w", newline="") as fh:
-            writer = csv.DictWriter(fh, fieldnames=stats.keys())
-            writer.writeheader()
-            writer.writerow(stats)
-
-        # e) Add row to summary buffer
-        row: Dict[str, str | float] = {"os": os_name, "version": version}
-        row.update(stats)
-        summary_rows.append(row)
+    toml_paths = sorted(calibration_folder.glob("calibration_*.toml"))
+
+    # the 2-D corners are identical for every toml: share one copy instead of pickling it per task
+    shm = SharedMemory(create=True, size=charuco_2d_xy.nbytes)
+    try:
+        np.ndarray(charuco_2d_xy.shape, dtype=charuco_2d_xy.dtype, buffer=shm.buf)[:] = charuco_2d_xy
+        max_workers = max(1, min(len(toml_paths), os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            summary_rows: List[Dict[str, str | float]] = list(executor.map(
+                _process_one_toml,
+                toml_paths,
+                repeat(shm.name),
+                repeat(charuco_2d_xy.shape),
+                repeat(charuco_2d_xy.dtype.str),
+                repeat(output_root),
+            ))
+    finally:
+        shm.close()
+        shm.unlink()
 
     # ----------------------------------------------------------------
     # 3. Write / append to summary.csv (wide format: one row per calibration)
     # ----------------------------------------------------------------
     summary_csv = output_root / "summary.csv"
-    fieldnames  = summary_rows[0].keys() if summary_rows else []
-
-    write_header = not summary_csv.exists()
-    with open(summary_csv, "a", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        if write_header:
-            writer.writeheader()
-        writer.writerows(summary_rows)
+    if summary_rows:
+        pd.DataFrame(summary_rows).to_csv(
+            summary_csv, mode="a", header=not summary_csv.exists(), index=False
+        )
 
     log.info(f"✓ Finished – per-calibration folders plus summary.csv written to {output_root}")
     
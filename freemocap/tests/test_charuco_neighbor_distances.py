@@ -0,0 +1,68 @@
+import numpy as np
+
+from freemocap.diagnostics.calibration.calibration_utils import (
+    get_charuco_neighbor_pairs,
+    get_neighbor_distances,
+)
+
+NUMBER_OF_SQUARES_WIDTH = 7
+NUMBER_OF_SQUARES_HEIGHT = 5
+NUMBER_OF_CORNERS = (NUMBER_OF_SQUARES_WIDTH - 1) * (NUMBER_OF_SQUARES_HEIGHT - 1)
+NUMBER_OF_PAIRS = len(get_charuco_neighbor_pairs(NUMBER_OF_SQUARES_HEIGHT - 1, NUMBER_OF_SQUARES_WIDTH - 1))
+
+
+def loop_neighbor_distances(number_of_squares_width: int,
+                            number_of_squares_height: int,
+                            charuco_3d_data: np.ndarray) -> np.ndarray:
+    """the original per-frame/per-pair loop, kept as the reference the vectorized version must match"""
+    distances_per_frame = []
+    neighbor_pairs = get_charuco_neighbor_pairs(number_of_squares_height - 1, number_of_squares_width - 1)
+    for points_3d in charuco_3d_data:
+        if np.isnan(points_3d).any():
+            continue
+        distances_per_frame.append([np.linalg.norm(points_3d[j] - points_3d[i]) for i, j in neighbor_pairs])
+    return np.array(distances_per_frame, dtype=np.float64)
+
+
+def test_get_neighbor_distances_matches_loop():
+    rng = np.random.default_rng(0)
+    charuco_3d_data = rng.normal(scale=100, size=(50, NUMBER_OF_CORNERS, 3))
+    # frames missing a single coordinate, a whole corner, and every corner - all must be skipped
+    charuco_3d_data[3, 0, 2] = np.nan
+    charuco_3d_data[10, 7, :] = np.nan
+    charuco_3d_data[20] = np.nan
+
+    expected = loop_neighbor_distances(NUMBER_OF_SQUARES_WIDTH, NUMBER_OF_SQUARES_HEIGHT, charuco_3d_data)
+    distances = get_neighbor_distances(
+        number_of_squares_width=NUMBER_OF_SQUARES_WIDTH,
+        number_of_squares_height=NUMBER_OF_SQUARES_HEIGHT,
+        charuco_3d_data=charuco_3d_data,
+    )
+
+    assert distances.shape == (47, NUMBER_OF_PAIRS), f"Unexpected shape {distances.shape}"
+    assert np.allclose(distances, expected), "Vectorized distances differ from the per-pair loop"
+
+    # float32 input (what calculate_calibration_diagnostics passes) agrees to float32 precision
+    distances_float32 = get_neighbor_distances(
+        number_of_squares_width=NUMBER_OF_SQUARES_WIDTH,
+        number_of_squares_height=NUMBER_OF_SQUARES_HEIGHT,
+        charuco_3d_data=charuco_3d_data.astype(np.float32),
+    )
+    assert np.allclose(distances_float32, expected, rtol=1e-5), "float32 distances differ from the per-pair loop"
+
+
+def test_get_neighbor_distances_no_complete_frames():
+    charuco_3d_data = np.ones((4, NUMBER_OF_CORNERS, 3))
+    charuco_3d_data[:, 0, 0] = np.nan
+
+    distances = get_neighbor_distances(
+        number_of_squares_width=NUMBER_OF_SQUARES_WIDTH,
+        number_of_squares_height=NUMBER_OF_SQUARES_HEIGHT,
+        charuco_3d_data=charuco_3d_data,
+    )
+
+    # the loop returned shape (0,) here; an empty (0, number of pairs) array holds the same (no) distances
+    assert distances.size == loop_neighbor_distances(
+        NUMBER_OF_SQUARES_WIDTH, NUMBER_OF_SQUARES_HEIGHT, charuco_3d_data
+    ).size == 0, "Frames with missing points were not skipped"
+    assert distances.shape == (0, NUMBER_OF_PAIRS), f"Unexpected shape {distances.shape}"
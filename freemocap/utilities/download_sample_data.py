@@ -1,5 +1,5 @@
-import io
 import logging
+import tempfile
 import zipfile
 from pathlib import Path
 
@@ -15,6 +15,8 @@ from freemocap.system.paths_and_filenames.path_getters import get_recording_sess
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE_BYTES = 1 << 20
+
 
 def get_sample_data_path(download_if_needed: bool = True) -> str:
     sample_data_path = str(Path(get_recording_session_folder_path()) / FREEMOCAP_TEST_DATA_RECORDING_NAME)
@@ -34,11 +36,17 @@ def download_sample_data(sample_data_zip_file_url: str = FIGSHARE_TEST_ZIP_FILE_
         recording_session_folder_path = Path(get_recording_session_folder_path())
         recording_session_folder_path.mkdir(parents=True, exist_ok=True)
 
-        r = requests.get(sample_data_zip_file_url, stream=True, timeout=(5, 60))
-        r.raise_for_status()  # Check if request was successful
+        # stream the archive to a temp file so peak memory is one chunk, not the whole zip
+        with tempfile.TemporaryDirectory() as temp_folder:
+            zip_file_path = Path(temp_folder) / "sample_data.zip"
+            r = requests.get(sample_data_zip_file_url, stream=True, timeout=(5, 60))
+            r.raise_for_status()  # Check if request was successful
+            with open(zip_file_path, "wb") as fh:
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
+                    fh.write(chunk)
 
-        z = zipfile.ZipFile(io.BytesIO(r.content))
-        z.extractall(recording_session_folder_path)
+            with zipfile.ZipFile(zip_file_path) as z:
+                z.extractall(recording_session_folder_path)
 
         if sample_data_zip_file_url == FIGSHARE_TEST_ZIP_FILE_URL:
             figshare_sample_data_path = recording_session_folder_path / FREEMOCAP_TEST_DATA_RECORDING_NAME